@@ -5,6 +5,8 @@
 import os
 import json
 import logging
+from argparse import Namespace
+from typing import Optional
 from tornado import web, ioloop
 from simuleval.data.segments import segment_from_json_string
 from simuleval import options
@@ -37,10 +39,11 @@ class InputHandler(SystemHandler):
         self.system.push(segment)
 
 
-def start_agent_service(system):
-    parser = options.general_parser()
-    options.add_evaluator_args(parser)
-    args, _ = parser.parse_known_args()
+def start_agent_service(system, args: Optional[Namespace] = None):
+    if args is None:
+        parser = options.general_parser()
+        options.add_evaluator_args(parser)
+        args, _ = parser.parse_known_args()
     app = web.Application(
         [
             (r"/reset", ResetHandle, {"system": system}),
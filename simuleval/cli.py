@@ -49,7 +49,7 @@ def main():
     system, args = build_system_args()
 
     if check_argument("standalone"):
-        start_agent_service(system)
+        start_agent_service(system, args)
         return
 
     # build evaluator
@@ -11,12 +11,13 @@ import numbers
 import os
 from argparse import Namespace
 from pathlib import Path
-from typing import Dict, Generator, Optional
+from typing import Dict, Optional
 
 import pandas
 import yaml
 from simuleval.data.dataloader import GenericDataloader, build_dataloader
 from simuleval.data.dataloader.dataloader import IterableDataloader
+from simuleval.utils.functional import read_last_line
 from tqdm import tqdm
 
 from .instance import INSTANCE_TYPE_DICT, LogInstance
@@ -126,13 +127,10 @@ class SentenceLevelEvaluator(object):
                     self.args.continue_unfinished
                     and (self.output / "instances.log").exists()
                 ):
-                    with open(self.output / "instances.log", "r") as f:
-                        line = None
-                        for line in f:  # noqa
-                            pass
-                        if line is not None:
-                            last_info = json.loads(line.strip())
-                            self.start_index = last_info["index"] + 1
+                    line = read_last_line(self.output / "instances.log")
+                    if line is not None:
+                        last_info = json.loads(line)
+                        self.start_index = last_info["index"] + 1
                 else:
                     self.output.mkdir(exist_ok=True, parents=True)
                     open(self.output / "instances.log", "w").close()
@@ -170,7 +168,7 @@ class SentenceLevelEvaluator(object):
         if self.output is not None:
             with open(self.output / "instances.log", "r") as f:
                 for line in f:
-                    instance = LogInstance(line.strip(), self.args.eval_latency_unit)
+                    instance = LogInstance(line, self.args.eval_latency_unit)
                     index = instance.index - self.start_index
                     self.instances[index] = instance
                     self.instances[index].set_target_spm_model(self.target_spm_model)
@@ -186,15 +184,12 @@ class SentenceLevelEvaluator(object):
     def __len__(self) -> int:
         return self.end_index - self.start_index
 
-    def get_indices(self) -> Generator:
+    def get_indices(self) -> range:
         if self.end_index < 0:
             self.end_index = max(self.instances.keys()) + 1
 
-        if self.start_index > self.end_index:
-            return []
-
-        for index in range(self.start_index, self.end_index):
-            yield index
+        # An empty range if start_index > end_index
+        return range(self.start_index, self.end_index)
 
     @property
     def quality(self) -> Dict[str, float]:
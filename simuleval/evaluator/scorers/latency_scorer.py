@@ -4,14 +4,15 @@
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
 
-from statistics import mean
+import itertools
 from pathlib import Path
 import subprocess
 import logging
-import textgrid
+import multiprocessing
+import os
 import sys
 import shutil
-from typing import List, Union, Dict
+from typing import List, Tuple, Union, Dict
 from simuleval.evaluator.instance import (
     TextInputInstance,
     TextOutputInstance,
@@ -38,6 +39,18 @@ def register_latency_scorer(name):
     return register
 
 
+def average(scores: List[Union[float, int]]) -> Union[float, int]:
+    """
+    Arithmetic mean, much faster than statistics.mean on float lists.
+    Like statistics.mean, integer scores with an integral mean give an int,
+    e.g. 3 rather than 3.0 for NumChunks.
+    """
+    total = sum(scores)
+    if isinstance(total, int) and total % len(scores) == 0:
+        return total // len(scores)
+    return total / len(scores)
+
+
 class LatencyScorer:
     metric = None
     add_duration = False
@@ -97,7 +110,7 @@ class LatencyScorer:
             ins.metrics[self.metric_name] = score
             scores.append(score)
 
-        return mean(scores)
+        return average(scores)
 
     @staticmethod
     def add_args(parser: ArgumentParser):
@@ -341,7 +354,7 @@ class ATDScorer(LatencyScorer):
                         f"Instance {index} has no computational delay information. Skipped"
                     )
                     continue
-                if elapsed != [0] * len(delays):
+                if len(elapsed) != len(delays) or any(elapsed):
                     compute_elapsed = self.subtract(elapsed, delays)
                     compute_times = self.subtract(
                         compute_elapsed, [0] + compute_elapsed[:-1]
@@ -356,7 +369,7 @@ class ATDScorer(LatencyScorer):
             token_to_time = {"src": [0], "tgt": [0]}
 
             tgt_token_lens = []
-            delays_no_duplicate = sorted(set(delays), key=delays.index)
+            delays_no_duplicate = list(dict.fromkeys(delays))
 
             if OUTPUT_TYPE == "text":
                 prev_delay = None
@@ -435,7 +448,7 @@ class ATDScorer(LatencyScorer):
 
             scores.append(self.compute(chunk_sizes, token_to_chunk, token_to_time))
 
-        return mean(scores)
+        return average(scores)
 
     def subtract(self, arr1, arr2):
         return [x - y for x, y in zip(arr1, arr2)]
@@ -457,28 +470,29 @@ class ATDScorer(LatencyScorer):
             float: the latency score on one sentence.
         """  # noqa C501
 
-        tgt_to_src = []
+        # acc_sizes[k] == sum(chunk_sizes[:k]), computed once per sentence
+        # instead of summing the chunk prefix again for every target token
+        acc_sizes = {
+            key: [0] + list(itertools.accumulate(sizes))
+            for key, sizes in chunk_sizes.items()
+        }
 
+        def acc_size(key, num_chunks):
+            return acc_sizes[key][min(num_chunks, len(acc_sizes[key]) - 1)]
+
+        atd_delay_sum = 0
         for t in range(1, len(token_to_chunk["tgt"])):
             chunk_id = token_to_chunk["tgt"][t]
-            AccSize_x = sum(chunk_sizes["src"][:chunk_id])
-            AccSize_y = sum(chunk_sizes["tgt"][:chunk_id])
+            AccSize_x = acc_size("src", chunk_id)
+            AccSize_y = acc_size("tgt", chunk_id)
 
             S = t - max(0, AccSize_y - AccSize_x)
-            current_src_size = sum(chunk_sizes["src"][: chunk_id + 1])
-
-            if S < current_src_size:
-                tgt_to_src.append((t, S))
-            else:
-                tgt_to_src.append((t, current_src_size))
+            current_src_size = acc_size("src", chunk_id + 1)
 
-        atd_delays = []
+            s = min(S, current_src_size)
+            atd_delay_sum += token_to_time["tgt"][t] - token_to_time["src"][s]
 
-        for t, s in tgt_to_src:
-            atd_delay = token_to_time["tgt"][t] - token_to_time["src"][s]
-            atd_delays.append(atd_delay)
-
-        return float(mean(atd_delays))
+        return float(atd_delay_sum / (len(token_to_chunk["tgt"]) - 1))
 
 
 @register_latency_scorer("NumChunks")
@@ -587,6 +601,67 @@ class RTFScorer(LatencyScorer):
         return delays[-1] / source_length
 
 
+def parse_textgrid_word_times(path: Path) -> Tuple[int, List[float], List[float]]:
+    """
+    Read the aligned words from a TextGrid file.
+    Defined at module level so that it can be run in worker processes.
+
+    Args:
+        path Path: TextGrid file named after the instance index.
+
+    Returns:
+        A tuple with the 3 elements:
+        index (int): Index of the instance.
+        start_times (List[float]): Start time of each word, in seconds.
+        end_times (List[float]): End time of each word, in seconds.
+    """
+    import textgrid
+
+    info = textgrid.TextGrid.fromFile(path)
+    words = [interval for interval in info[0] if len(interval.mark) > 0]
+    return (
+        int(path.name.split("_")[0]),
+        [interval.minTime for interval in words],
+        [interval.maxTime for interval in words],
+    )
+
+
+TEXTGRID_CHUNK_SIZE = 16
+
+
+def load_alignment_word_times(
+    align_dir: Path,
+) -> Dict[int, Tuple[List[float], List[float]]]:
+    """
+    Args:
+        align_dir Path: Directory with the TextGrid files produced by mfa.
+
+    Returns:
+        Dict[int, Tuple[List[float], List[float]]]: Start and end times of
+        the aligned words, indexed by instance.
+    """
+    textgrid_files = [
+        file for file in align_dir.iterdir() if file.name.endswith("TextGrid")
+    ]
+    if len(textgrid_files) <= 2 * TEXTGRID_CHUNK_SIZE:
+        # Not worth starting worker processes for only a few files
+        parsed = [parse_textgrid_word_times(file) for file in textgrid_files]
+    else:
+        processes = min(os.cpu_count() or 1, len(textgrid_files))
+        # Spawn fresh workers instead of forking the evaluating process,
+        # which holds the agent (possibly a CUDA context) and live threads
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(processes) as pool:
+            parsed = list(
+                pool.imap_unordered(
+                    parse_textgrid_word_times,
+                    textgrid_files,
+                    chunksize=TEXTGRID_CHUNK_SIZE,
+                )
+            )
+    return {index: (start_times, end_times) for index, start_times, end_times in parsed}
+
+
 def speechoutput_alignment_latency_scorer(scorer_class):  # noqa C901
     class Klass(scorer_class):
         def __init__(self, **kargs) -> None:
@@ -610,12 +685,7 @@ def speechoutput_alignment_latency_scorer(scorer_class):  # noqa C901
             return super().__call__(instances)
 
         def prepare_alignment(self, instances):
-            try:
-                subprocess.check_output(
-                    "mfa version", shell=True, stderr=subprocess.STDOUT
-                )
-            except subprocess.CalledProcessError as grepexc:
-                logger.error(grepexc.output.decode("utf-8").strip())
+            if shutil.which("mfa") is None:
                 logger.error("Please make sure the mfa>=2.0.6 is correctly installed. ")
                 sys.exit(1)
 
@@ -649,24 +719,19 @@ def speechoutput_alignment_latency_scorer(scorer_class):  # noqa C901
             else:
                 logger.info("Found existing alignment")
 
-            for file in align_dir.iterdir():
-                if file.name.endswith("TextGrid"):
-                    index = int(file.name.split("_")[0])
-                    target_offset = instances[index].delays[0]
-                    info = textgrid.TextGrid.fromFile(file)
-                    delays = []
-                    for interval in info[0]:
-                        if len(interval.mark) > 0:
-                            if self.boundary_type == "BOW":
-                                delays.append(target_offset + 1000 * interval.minTime)
-                            elif self.boundary_type == "EOW":
-                                delays.append(target_offset + 1000 * interval.maxTime)
-                            else:
-                                delays.append(
-                                    target_offset
-                                    + 0.5 * (interval.maxTime + interval.minTime) * 1000
-                                )
-                    setattr(instances[index], self.timestamp_type, delays)
+            word_times = load_alignment_word_times(align_dir)
+            for index, (start_times, end_times) in word_times.items():
+                target_offset = instances[index].delays[0]
+                if self.boundary_type == "BOW":
+                    delays = [target_offset + 1000 * start for start in start_times]
+                elif self.boundary_type == "EOW":
+                    delays = [target_offset + 1000 * end for end in end_times]
+                else:
+                    delays = [
+                        target_offset + 0.5 * (end + start) * 1000
+                        for start, end in zip(start_times, end_times)
+                    ]
+                setattr(instances[index], self.timestamp_type, delays)
 
     return Klass
 
@@ -7,6 +7,7 @@
 import logging
 import string
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict
 
@@ -73,8 +74,9 @@ class WERScorer(QualityScorer):
         distance = 0
         ref_length = 0
         for ins in instances.values():
-            distance += self.ed.eval(ins.prediction.split(), ins.reference.split())
-            ref_length += len(ins.reference.split())
+            reference = ins.reference.split()
+            distance += self.ed.eval(ins.prediction.split(), reference)
+            ref_length += len(reference)
             if ref_length == 0:
                 self.logger.warning("Reference length is 0. Return WER as 0.")
                 return 0
@@ -211,10 +213,14 @@ class ASRSacreBLEUScorer(QualityScorer):
         with open(transcripts_path, "r") as f:
             transcripts = [line.strip() for line in f]
 
-        for idx, item in enumerate(transcripts):
+        def write_transcript(idx, item):
             with open(wav_dir / f"{idx}_pred.txt", "w") as f:
                 f.write(item.lower() + "\n")
 
+        # Overlap the per-file open/close instead of paying them one by one
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            list(executor.map(write_transcript, range(len(transcripts)), transcripts))
+
         return transcripts
 
     @staticmethod
@@ -4,11 +4,13 @@
 # This source code is licensed under the license found in the
 # LICENSE file in the root directory of this source tree.
 
+import json
 import os
 import tempfile
 from pathlib import Path
 
 import simuleval.cli as cli
+from simuleval.utils.functional import read_last_line
 
 ROOT_PATH = Path(__file__).parents[2]
 
@@ -30,3 +32,52 @@ def test_score_only(root_path=ROOT_PATH):
         cli.main()
         cli.sys.argv[1:] = ["--score-only", "--output", tmpdirname]
         cli.main()
+
+
+def test_continue_unfinished(root_path=ROOT_PATH):
+    source = os.path.join(root_path, "examples", "quick_start", "source.txt")
+    with open(source) as f:
+        num_sentences = len(f.read().splitlines())
+
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        args = [
+            "--user-dir",
+            os.path.join(root_path, "examples"),
+            "--agent-class",
+            "examples.quick_start.first_agent.DummyWaitkTextAgent",
+            "--source",
+            source,
+            "--target",
+            os.path.join(root_path, "examples", "quick_start", "target.txt"),
+            "--output",
+            tmpdirname,
+        ]
+        cli.sys.argv[1:] = args + ["--end-index", "3"]
+        cli.main()
+        cli.sys.argv[1:] = args + ["--continue-unfinished"]
+        cli.main()
+
+        with open(Path(tmpdirname) / "instances.log") as f:
+            indices = [json.loads(line)["index"] for line in f]
+        assert indices == list(range(num_sentences))
+
+
+def test_read_last_line():
+    with tempfile.TemporaryDirectory() as tmpdirname:
+        path = Path(tmpdirname) / "log"
+
+        path.write_text("")
+        assert read_last_line(path) is None
+
+        path.write_text("first\nsecond")
+        assert read_last_line(path) == "second"
+
+        path.write_text("first\nsecond\n")
+        assert read_last_line(path) == "second\n"
+
+        long_line = "x" * 100
+        path.write_text("first\n" + long_line + "\n")
+        assert read_last_line(path, block_size=8) == long_line + "\n"
+
+        path.write_text(long_line)
+        assert read_last_line(path, block_size=8) == long_line
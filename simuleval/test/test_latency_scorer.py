@@ -0,0 +1,68 @@
+# Copyright (c) Facebook, Inc. and its affiliates.
+# All rights reserved.
+#
+# This source code is licensed under the license found in the
+# LICENSE file in the root directory of this source tree.
+
+import json
+
+import pytest
+
+from simuleval.evaluator.instance import LogInstance, TextToTextInstance
+from simuleval.evaluator.scorers.latency_scorer import ATDScorer
+
+# Expected values were computed with the original ATD implementation.
+
+
+def build_text_instances(delays_list):
+    instances = {}
+    for index, delays in enumerate(delays_list):
+        instance = TextToTextInstance(index, None, None)
+        instance.delays = delays
+        instances[index] = instance
+    return instances
+
+
+def build_log_instances(delays_elapsed_list):
+    return {
+        index: LogInstance(
+            json.dumps({"index": index, "delays": delays, "elapsed": elapsed})
+        )
+        for index, (delays, elapsed) in enumerate(delays_elapsed_list)
+    }
+
+
+SPEECH_DELAYS_ELAPSED = [
+    ([300, 300, 900, 1500], [350, 420, 1000, 1700]),
+    ([0, 600, 600], [100, 700, 800]),
+]
+
+
+def test_atd_text_input():
+    instances = build_text_instances([[1, 1, 2, 3, 3, 5]])
+    assert ATDScorer()(instances) == pytest.approx(13 / 6)
+
+    instances = build_text_instances([[1, 2, 3], [2, 2, 4, 4]])
+    assert ATDScorer()(instances) == pytest.approx(1.5)
+
+
+def test_atd_text_input_more_target_than_source_chunks():
+    # Non-monotonic delays give more target chunks than source chunks,
+    # so the accumulated chunk sizes are looked up past their end.
+    instances = build_text_instances([[2, 1, 2]])
+    assert ATDScorer()(instances) == pytest.approx(3.0)
+
+
+def test_atd_speech_input():
+    instances = build_log_instances(SPEECH_DELAYS_ELAPSED)
+    assert ATDScorer()(instances) == pytest.approx(125.0)
+
+
+def test_atd_computation_aware():
+    instances = build_log_instances(SPEECH_DELAYS_ELAPSED)
+    scorer = ATDScorer(computation_aware=True)
+    assert scorer(instances) == pytest.approx(189.58333333333331)
+
+    # All-zero elapsed times are used as the compute times directly
+    instances = build_log_instances([([300, 900], [0, 0])])
+    assert scorer(instances) == pytest.approx(150.0)
@@ -135,15 +135,16 @@ def build_system_args(
         system = build_system_from_dir(
             check_argument("system_dir"), check_argument("system_config"), config_dict
         )
+        args = parser.parse_args(cli_arguments)
     else:
         system_class = get_agent_class(config_dict)
         system_class.add_args(parser)
         add_command_helper_arg(parser)
-        args, _ = parser.parse_known_args(cli_argument_list(config_dict))
+        # The parser is complete here, so one strict parse serves both
+        # the system and the evaluator.
+        args = parser.parse_args(cli_arguments)
         system = system_class.from_args(args)
 
-    args = parser.parse_args(cli_argument_list(config_dict))
-
     dtype = args.dtype if args.dtype else "fp16" if args.fp16 else "fp32"
     logger.info(f"System will run on device: {args.device}. dtype: {dtype}")
     system.to(args.device, fp16=(dtype == "fp16"))
@@ -1,5 +1,7 @@
+import functools
 import sys
-from typing import Optional
+from argparse import Namespace
+from typing import Optional, Tuple
 from simuleval import options
 
 
@@ -19,7 +21,14 @@ def cli_argument_list(config_dict: Optional[dict]):
     return sys.argv[1:] + string.split()
 
 
-def check_argument(name: str, config_dict: Optional[dict] = None):
+@functools.lru_cache(maxsize=1)
+def _early_args(cli_arguments: Tuple[str, ...]) -> Namespace:
+    # Keyed on the argument list so that a changed sys.argv
+    # (e.g. consecutive cli.main() calls in tests) is parsed again.
     parser = options.general_parser()
-    args, _ = parser.parse_known_args(cli_argument_list(config_dict))
-    return getattr(args, name)
+    args, _ = parser.parse_known_args(list(cli_arguments))
+    return args
+
+
+def check_argument(name: str, config_dict: Optional[dict] = None):
+    return getattr(_early_args(tuple(cli_argument_list(config_dict))), name)
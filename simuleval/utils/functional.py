@@ -5,7 +5,10 @@
 # LICENSE file in the root directory of this source tree.
 
 from contextlib import closing
+import os
 import socket
+from pathlib import Path
+from typing import Optional, Union
 
 
 def find_free_port():
@@ -13,3 +16,27 @@ def find_free_port():
         s.bind(("", 0))
         s.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
         return s.getsockname()[1]
+
+
+def read_last_line(path: Union[Path, str], block_size: int = 4096) -> Optional[str]:
+    """
+    Read the last line of a file by seeking backwards from its end,
+    so that the cost does not grow with the size of the file.
+    Returns None for an empty file.
+    """
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        tail = b""
+        while position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            tail = f.read(step) + tail
+            # Skip the newline terminating the last line itself
+            newline = tail.rfind(b"\n", 0, len(tail) - 1)
+            if newline >= 0:
+                return tail[newline + 1 :].decode("utf-8")  # noqa E203
+    if len(tail) == 0:
+        return None
+    return tail.decode("utf-8")